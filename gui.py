@@ -5,14 +5,23 @@ CustomTkinter-based high-DPI interface with "Stealth Mode" theme.
 Dark black background, neon green text - cinematic CIA/NSA terminal aesthetic.
 """
 
+import functools
 import os
+import queue
 import sys
 import threading
+import time
+import tkinter as tk
 from typing import Callable, Optional
 
 import customtkinter as ctk
 
 
+# Set dark theme once, before any CTk widget is constructed
+ctk.set_appearance_mode("dark")
+ctk.set_default_color_theme("dark-blue")
+
+
 # Theme Colors - Stealth Mode
 class Colors:
     """Stealth Mode color palette."""
@@ -30,6 +39,45 @@ class Colors:
     BORDER = "#00ff41"              # Border color
 
 
+# Status token -> indicator color (anything else falls back to neon green)
+_STATUS_COLOR = {
+    "ARMED": Colors.NEON_GREEN,
+    "SECURE": Colors.NEON_GREEN,
+    "LOW": Colors.NEON_GREEN,
+    "LOCKED": Colors.WARNING_YELLOW,
+    "NO KEY": Colors.WARNING_YELLOW,
+    "MEDIUM": Colors.WARNING_YELLOW,
+    "NO CAMERA": Colors.WARNING_YELLOW,
+    "BYPASSED": Colors.WARNING_YELLOW,
+    "BREACH": Colors.DANGER_RED,
+    "REMOVED": Colors.DANGER_RED,
+    "CRITICAL": Colors.DANGER_RED,
+    "HIGH": Colors.DANGER_RED,
+    "ERROR": Colors.DANGER_RED,
+}
+
+# Every token the status panel can show, including the uncolored ones
+_STATUS_TOKENS = (*_STATUS_COLOR, "INITIALIZING", "SCANNING", "DISABLED")
+
+
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal", family: str = "Consolas") -> ctk.CTkFont:
+    """Return a shared CTkFont for the given size/weight/family."""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+# Consolas is monospace: cache one character width per font size
+_MONO_WIDTH_CACHE: dict[int, int] = {}
+
+
+def _mono_w(size: int, text: str) -> int:
+    """Return the pixel width of text in the monospace font at the given size."""
+    char_w = _MONO_WIDTH_CACHE.get(size)
+    if char_w is None:
+        char_w = _MONO_WIDTH_CACHE.setdefault(size, _font(size, "bold").measure("0"))
+    return char_w * len(text)
+
+
 class StatusPanel(ctk.CTkFrame):
     """Security status panel showing camera, USB, and threat level."""
     
@@ -46,93 +94,104 @@ class StatusPanel(ctk.CTkFrame):
         # Status indicators dictionary for easy updates (must be initialized first)
         self._status_labels = {}
         
+        # Last value applied per label widget, used to skip redundant reconfigures
+        self._last_values = {}
+        
+        # Single two-column grid: fixed-width labels, expanding values
+        self.grid_columnconfigure(0, weight=0)
+        self.grid_columnconfigure(1, weight=1)
+        
         # Title
         self.title_label = ctk.CTkLabel(
             self,
             text="▓▓▓ STATUS PANEL ▓▓▓",
-            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=Colors.NEON_GREEN
         )
-        self.title_label.pack(pady=(15, 20), padx=10)
+        self.title_label.grid(row=0, column=0, columnspan=2, pady=(15, 20), padx=10)
         
         # Separator line
         self.separator1 = ctk.CTkFrame(self, height=1, fg_color=Colors.NEON_GREEN_DARK)
-        self.separator1.pack(fill="x", padx=10, pady=5)
+        self.separator1.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         
         # Camera Status
-        self.camera_frame = self._create_status_row("CAMERA:", "INITIALIZING")
-        self.camera_frame.pack(fill="x", padx=10, pady=10)
+        self._add_status_row(2, "CAMERA:", "INITIALIZING")
         
         # USB Status
-        self.usb_frame = self._create_status_row("USB KEY:", "SCANNING")
-        self.usb_frame.pack(fill="x", padx=10, pady=10)
+        self._add_status_row(3, "USB KEY:", "SCANNING")
         
         # Separator line
         self.separator2 = ctk.CTkFrame(self, height=1, fg_color=Colors.NEON_GREEN_DARK)
-        self.separator2.pack(fill="x", padx=10, pady=10)
+        self.separator2.grid(row=4, column=0, columnspan=2, sticky="ew", padx=10, pady=10)
         
         # Threat Level
-        self.threat_frame = self._create_status_row("THREAT:", "LOW")
-        self.threat_frame.pack(fill="x", padx=10, pady=10)
+        self._add_status_row(5, "THREAT:", "LOW")
     
-    def _create_status_row(self, label_text: str, value_text: str) -> ctk.CTkFrame:
-        """Create a status row with label and value."""
-        frame = ctk.CTkFrame(self, fg_color="transparent")
-        
+    def _add_status_row(self, row_idx: int, label_text: str, value_text: str) -> None:
+        """Add a status row with label and value to the panel grid."""
         label = ctk.CTkLabel(
-            frame,
+            self,
             text=label_text,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=_font(12),
             text_color=Colors.TEXT_SECONDARY,
             anchor="w",
             width=80
         )
-        label.pack(side="left", padx=(5, 10))
+        label.grid(row=row_idx, column=0, sticky="w", padx=(15, 10), pady=10)
         
+        # Fixed width sized for the longest status token, so text changes
+        # never trigger a re-measure and re-layout of the grid
         value = ctk.CTkLabel(
-            frame,
+            self,
             text=f"[{value_text}]",
-            font=ctk.CTkFont(family="Consolas", size=12, weight="bold"),
+            font=_font(12, "bold"),
             text_color=Colors.NEON_GREEN,
-            anchor="w"
+            anchor="w",
+            width=_mono_w(12, f"[{max(_STATUS_TOKENS, key=len)}]")
         )
-        value.pack(side="left", fill="x", expand=True)
+        value.grid(row=row_idx, column=1, sticky="ew", padx=(0, 10), pady=10)
         
         # Store reference to value label
         key = label_text.replace(":", "").lower().replace(" ", "_")
         self._status_labels[key] = value
-        
-        return frame
+        # Short alias used by the monitors ("usb" -> "usb_key")
+        self._status_labels[key.replace("_key", "")] = value
     
     def update_status(self, key: str, value: str) -> None:
         """Update a status indicator."""
-        # Map keys to label references
-        key_map = {
-            "camera": "camera",
-            "usb": "usb_key",
-            "threat": "threat"
-        }
-        
-        label_key = key_map.get(key, key)
-        
-        if label_key in self._status_labels:
-            label = self._status_labels[label_key]
-            label.configure(text=f"[{value}]")
-            
-            # Set color based on status
-            if value in ["ARMED", "SECURE", "LOW"]:
-                label.configure(text_color=Colors.NEON_GREEN)
-            elif value in ["LOCKED", "NO KEY", "MEDIUM", "NO CAMERA", "BYPASSED"]:
-                label.configure(text_color=Colors.WARNING_YELLOW)
-            elif value in ["BREACH", "REMOVED", "CRITICAL", "HIGH", "ERROR"]:
-                label.configure(text_color=Colors.DANGER_RED)
-            else:
-                label.configure(text_color=Colors.NEON_GREEN)
+        label = self._status_labels.get(key)
+        if label is None:
+            return
+        
+        # Skip the reconfigure if nothing changed
+        if self._last_values.get(label) == value:
+            return
+        self._last_values[label] = value
+        
+        # Set text and status color in a single configure
+        color = _STATUS_COLOR.get(value, Colors.NEON_GREEN)
+        label.configure(text=f"[{value}]", text_color=color)
 
 
 class SecretTextArea(ctk.CTkFrame):
     """Encrypted text area for storing secrets."""
     
+    PLACEHOLDER = """
+╔══════════════════════════════════════════════════════════════════╗
+║                     GHOST-PROTOCOL VAULT                         ║
+║━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━║
+║                                                                  ║
+║  ► All data is encrypted in RAM only                            ║
+║  ► Nothing is written to disk                                   ║
+║  ► Security monitors are active                                 ║
+║                                                                  ║
+║  Type your classified notes below...                             ║
+║                                                                  ║
+╚══════════════════════════════════════════════════════════════════╝
+"""
+    
+    TEXT_FONT = ("Consolas", 14)  # Unscaled pixel size, like CTkFont(size=14)
+    
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         
@@ -150,43 +209,69 @@ class SecretTextArea(ctk.CTkFrame):
         self.header_label = ctk.CTkLabel(
             self.header_frame,
             text="█▀▀ CLASSIFIED NOTES █▀▀",
-            font=ctk.CTkFont(family="Consolas", size=16, weight="bold"),
+            font=_font(16, "bold"),
             text_color=Colors.NEON_GREEN
         )
         self.header_label.pack(pady=10)
         
-        # Text area
-        self.textbox = ctk.CTkTextbox(
+        # Scrollbar for the text area (tk.Text has none of its own)
+        self.scrollbar = ctk.CTkScrollbar(self, orientation="vertical")
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        
+        # Text area - native tk.Text, bypassing the CTkTextbox wrapper.
+        # Undo history is disabled so no copies of secrets linger in it.
+        # The font is a scaled pixel size, matching what CTkTextbox used.
+        self.textbox = tk.Text(
             self,
-            font=ctk.CTkFont(family="Consolas", size=14),
-            fg_color=Colors.BACKGROUND,
-            text_color=Colors.NEON_GREEN,
-            border_width=0,
-            corner_radius=0,
-            wrap="word"
+            font=self._apply_font_scaling(self.TEXT_FONT),
+            bg=Colors.BACKGROUND,
+            fg=Colors.NEON_GREEN,
+            insertbackground=Colors.NEON_GREEN,
+            bd=0,
+            highlightthickness=0,
+            wrap="word",
+            undo=False,
+            yscrollcommand=self.scrollbar.set
         )
-        self.textbox.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Placeholder text
-        self._set_placeholder()
+        self.textbox.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        self.scrollbar.configure(command=self.textbox.yview)
+        
+        # Placeholder - a ghost label overlaid on the empty text area,
+        # dismissed on the first keypress instead of inserted as content
+        self._placeholder = ctk.CTkLabel(
+            self.textbox,
+            text=self.PLACEHOLDER,
+            font=_font(14),
+            text_color=Colors.TEXT_SECONDARY,
+            justify="left",
+            anchor="nw"
+        )
+        self._placeholder.place(relx=0.02, rely=0.02, anchor="nw")
+        # Clicking the overlay focuses the text area; pastes also dismiss it
+        self._placeholder.bind("<Button-1>", self._on_placeholder_click)
+        self._placeholder_binds = [
+            (sequence, self.textbox.bind(sequence, self._dismiss_placeholder, add="+"))
+            for sequence in ("<KeyPress>", "<<Paste>>", "<<PasteSelection>>")
+        ]
     
-    def _set_placeholder(self) -> None:
-        """Set placeholder text in the text area."""
-        placeholder = """
-╔══════════════════════════════════════════════════════════════════╗
-║                     GHOST-PROTOCOL VAULT                         ║
-║━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━║
-║                                                                  ║
-║  ► All data is encrypted in RAM only                            ║
-║  ► Nothing is written to disk                                   ║
-║  ► Security monitors are active                                 ║
-║                                                                  ║
-║  Type your classified notes below...                             ║
-║                                                                  ║
-╚══════════════════════════════════════════════════════════════════╝
-
-"""
-        self.textbox.insert("1.0", placeholder)
+    def _on_placeholder_click(self, event=None) -> None:
+        """Focus the text area when the placeholder overlay is clicked."""
+        self._dismiss_placeholder()
+        self.textbox.focus_set()
+    
+    def _dismiss_placeholder(self, event=None) -> None:
+        """Hide the placeholder overlay and stop listening for input."""
+        if not self._placeholder_binds:
+            return
+        self._placeholder.place_forget()
+        for sequence, bind_id in self._placeholder_binds:
+            self.textbox.unbind(sequence, bind_id)
+        self._placeholder_binds = []
+    
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        # tk.Text is not a CTk widget, so rescale its font by hand
+        self.textbox.configure(font=self._apply_font_scaling(self.TEXT_FONT))
     
     def get_text(self) -> str:
         """Get the current text content."""
@@ -234,7 +319,7 @@ class BlurOverlay(ctk.CTkFrame):
 ██                    ██
 ████████████████████████
 """,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=_font(12),
             text_color=Colors.NEON_GREEN_DIM
         )
         self.lock_label.pack()
@@ -243,7 +328,7 @@ class BlurOverlay(ctk.CTkFrame):
         self.message_label = ctk.CTkLabel(
             self.center_frame,
             text="PRIVACY SHIELD ENGAGED",
-            font=ctk.CTkFont(family="Consolas", size=24, weight="bold"),
+            font=_font(24, "bold"),
             text_color=Colors.WARNING_YELLOW
         )
         self.message_label.pack(pady=20)
@@ -252,27 +337,50 @@ class BlurOverlay(ctk.CTkFrame):
         self.instruction_label = ctk.CTkLabel(
             self.center_frame,
             text="Return to terminal to restore access",
-            font=ctk.CTkFont(family="Consolas", size=14),
+            font=_font(14),
             text_color=Colors.TEXT_SECONDARY
         )
         self.instruction_label.pack()
         
-        # Hide by default
-        self.place_forget()
+        # The content is static: measure it once and freeze the container
+        # geometry so show() never has to re-layout the ASCII art
+        self.center_frame.update_idletasks()
+        self.center_frame.configure(
+            width=self.center_frame._reverse_widget_scaling(self.center_frame.winfo_reqwidth()),
+            height=self.center_frame._reverse_widget_scaling(self.center_frame.winfo_reqheight())
+        )
+        self.center_frame.pack_propagate(False)
+        
+        # Place once over the whole window and hide it below its siblings;
+        # show/hide then only touch the stacking order, not the geometry
+        self.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.lower()
     
     def show(self) -> None:
         """Show the blur overlay."""
-        self.place(relx=0, rely=0, relwidth=1, relheight=1)
         self.lift()
     
     def hide(self) -> None:
         """Hide the blur overlay."""
-        self.place_forget()
+        self.lower()
 
 
 class GhostProtocolGUI(ctk.CTk):
     """Main GHOST-PROTOCOL GUI application."""
     
+    STATUS_POLL_MS = 50  # Drain queued status updates at 20 Hz
+    BLUR_DEBOUNCE_MS = 150  # Settle time before a blur toggle is applied
+    TOGGLE_COOLDOWN = 0.15  # Seconds to swallow repeated wipe requests
+    
+    # Manual panic console message, preformatted so it is emitted in one write
+    _PANIC_MSG = (
+        "\n" + "=" * 60 + "\n"
+        "[CRITICAL] ████ MANUAL PANIC INITIATED ████\n"
+        "[CRITICAL] EMERGENCY WIPE BUTTON ACTIVATED!\n"
+        "[CRITICAL] INITIATING PROTOCOL 0.\n"
+        + "=" * 60 + "\n\n"
+    )
+    
     def __init__(self, 
                  panic_callback: Optional[Callable[[], None]] = None,
                  bypass_usb: bool = False):
@@ -285,19 +393,33 @@ class GhostProtocolGUI(ctk.CTk):
         """
         super().__init__()
         
+        # Keep the window unmapped while building so layout runs once at the end.
+        # CTk already holds it withdrawn until mainloop() on Windows, and its
+        # withdraw() bookkeeping would then keep the window hidden for good.
+        defer_map = sys.platform != "win32"
+        if defer_map:
+            self.withdraw()
+        
         self.panic_callback = panic_callback
         self.bypass_usb = bypass_usb
         self._is_locked = False
         
+        # Privacy overlay is built lazily on first use (see _show_blur)
+        self.blur_overlay: Optional[BlurOverlay] = None
+        
+        # Debounce state for blur toggles and wipe flashes
+        self._blur_requested = False
+        self._blur_after_id: Optional[str] = None
+        self._last_wipe_ts = 0.0
+        
+        # Inbox for status updates posted by monitor threads
+        self._status_q: queue.SimpleQueue = queue.SimpleQueue()
+        
         # Configure window
         self.title("GHOST-PROTOCOL v1.0 // CLASSIFIED")
         self.geometry("1200x800")
         self.minsize(900, 600)
         
-        # Set dark theme
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("dark-blue")
-        
         # Configure colors
         self.configure(fg_color=Colors.BACKGROUND)
         
@@ -305,7 +427,14 @@ class GhostProtocolGUI(ctk.CTk):
         self._build_header()
         self._build_main_content()
         self._build_footer()
-        self._build_blur_overlay()
+        
+        # Single layout pass, then map the window
+        self.update_idletasks()
+        if defer_map:
+            self.deiconify()
+        
+        # Start draining monitor status updates on the GUI thread
+        self.after(self.STATUS_POLL_MS, self._drain_status)
         
         # Print startup banner to console
         self._print_startup_banner()
@@ -333,7 +462,9 @@ class GhostProtocolGUI(ctk.CTk):
 ║                                                                               ║
 ╚═══════════════════════════════════════════════════════════════════════════════╝
 """
-        print(banner)
+        # Single write for the whole banner rather than line-buffered print
+        sys.stdout.write(banner + "\n")
+        sys.stdout.flush()
     
     def _build_header(self) -> None:
         """Build the header section."""
@@ -350,7 +481,7 @@ class GhostProtocolGUI(ctk.CTk):
         self.title_label = ctk.CTkLabel(
             self.header_frame,
             text="◢◤ GHOST-PROTOCOL v1.0 ◢◤",
-            font=ctk.CTkFont(family="Consolas", size=20, weight="bold"),
+            font=_font(20, "bold"),
             text_color=Colors.NEON_GREEN
         )
         self.title_label.pack(side="left", padx=20, pady=15)
@@ -359,7 +490,7 @@ class GhostProtocolGUI(ctk.CTk):
         self.classification_label = ctk.CTkLabel(
             self.header_frame,
             text="▓▓▓ TOP SECRET // NOFORN ▓▓▓",
-            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=Colors.DANGER_RED
         )
         self.classification_label.pack(side="left", expand=True)
@@ -368,7 +499,7 @@ class GhostProtocolGUI(ctk.CTk):
         self.status_indicator = ctk.CTkLabel(
             self.header_frame,
             text="● ONLINE",
-            font=ctk.CTkFont(family="Consolas", size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=Colors.NEON_GREEN
         )
         self.status_indicator.pack(side="right", padx=20)
@@ -389,7 +520,7 @@ class GhostProtocolGUI(ctk.CTk):
         # Right side - Status panel
         self.status_panel = StatusPanel(self.main_frame, width=220)
         self.status_panel.pack(side="right", fill="y")
-        self.status_panel.pack_propagate(False)
+        self.status_panel.grid_propagate(False)
     
     def _build_footer(self) -> None:
         """Build the footer with panic button."""
@@ -406,7 +537,7 @@ class GhostProtocolGUI(ctk.CTk):
         self.instructions_label = ctk.CTkLabel(
             self.footer_frame,
             text="[ESC] Emergency Wipe  |  [F1] Toggle Camera  |  [F2] Toggle USB Guard",
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=_font(11),
             text_color=Colors.TEXT_SECONDARY
         )
         self.instructions_label.pack(side="left", padx=20, pady=25)
@@ -415,7 +546,7 @@ class GhostProtocolGUI(ctk.CTk):
         self.panic_button = ctk.CTkButton(
             self.footer_frame,
             text="⚠ EMERGENCY WIPE ⚠",
-            font=ctk.CTkFont(family="Consolas", size=16, weight="bold"),
+            font=_font(16, "bold"),
             fg_color=Colors.DANGER_RED,
             hover_color="#cc0033",
             text_color="#ffffff",
@@ -435,33 +566,69 @@ class GhostProtocolGUI(ctk.CTk):
     
     def _on_panic_button(self) -> None:
         """Handle panic button press."""
-        print("")
-        print("=" * 60)
-        print("[CRITICAL] ████ MANUAL PANIC INITIATED ████")
-        print("[CRITICAL] EMERGENCY WIPE BUTTON ACTIVATED!")
-        print("[CRITICAL] INITIATING PROTOCOL 0.")
-        print("=" * 60)
-        print("")
+        sys.stdout.write(self._PANIC_MSG)
+        sys.stdout.flush()
         
         if self.panic_callback:
             self.panic_callback()
     
+    # NOTE: The methods below may be called from security monitor threads.
+    # Tk is single-threaded, so every widget mutation must be marshalled onto
+    # the GUI thread - via the status queue, or with after_idle() (no timer,
+    # unlike after(0, ...)).
+    
     def update_status(self, key: str, value: str) -> None:
         """Update a status panel indicator."""
-        # Thread-safe status update
-        self.after(0, lambda: self.status_panel.update_status(key, value))
+        # Thread-safe status update - applied by the periodic _drain_status pump
+        self._status_q.put((key, value))
+    
+    def _drain_status(self) -> None:
+        """Apply all queued status updates on the GUI thread and reschedule."""
+        pending = {}
+        while True:
+            try:
+                key, value = self._status_q.get_nowait()
+            except queue.Empty:
+                break
+            pending[key] = value
+        
+        for key, value in pending.items():
+            self.status_panel.update_status(key, value)
+        
+        self.after(self.STATUS_POLL_MS, self._drain_status)
     
     def set_blur(self, blur: bool) -> None:
         """Show or hide the privacy blur overlay."""
-        def _update():
-            if blur:
-                self.blur_overlay.show()
-                self._is_locked = True
-            else:
-                self.blur_overlay.hide()
-                self._is_locked = False
-        
-        self.after(0, _update)
+        # Trailing-edge debounce: only the last state of a flapping burst is applied
+        self._blur_requested = blur
+        self.after_idle(self._schedule_blur)
+    
+    def _schedule_blur(self) -> None:
+        """(Re)start the blur debounce timer (GUI thread only)."""
+        if self._blur_after_id is not None:
+            self.after_cancel(self._blur_after_id)
+        self._blur_after_id = self.after(self.BLUR_DEBOUNCE_MS, self._apply_blur)
+    
+    def _apply_blur(self) -> None:
+        """Apply the most recently requested blur state (GUI thread only)."""
+        self._blur_after_id = None
+        if self._blur_requested:
+            self._show_blur()
+        else:
+            self._hide_blur()
+    
+    def _show_blur(self) -> None:
+        """Engage the privacy blur overlay (GUI thread only)."""
+        if self.blur_overlay is None:
+            self._build_blur_overlay()
+        self.blur_overlay.show()
+        self._is_locked = True
+    
+    def _hide_blur(self) -> None:
+        """Disengage the privacy blur overlay (GUI thread only)."""
+        if self.blur_overlay is not None:
+            self.blur_overlay.hide()
+        self._is_locked = False
     
     def get_secret_text(self) -> str:
         """Get the current secret text."""
@@ -469,14 +636,27 @@ class GhostProtocolGUI(ctk.CTk):
     
     def clear_secrets(self) -> None:
         """Clear the secret text area."""
-        self.after(0, self.secret_area.clear)
+        self.after_idle(self.secret_area.clear)
     
     def show_wipe_animation(self) -> None:
         """Show a visual indication that memory is being wiped."""
-        def _animate():
-            # Flash red background
-            self.configure(fg_color=Colors.DANGER_RED)
-            self.update()
-            self.after(100, lambda: self.configure(fg_color=Colors.BACKGROUND))
-        
-        self.after(0, _animate)
+        now = time.monotonic()
+        if now - self._last_wipe_ts < self.TOGGLE_COOLDOWN:
+            return
+        self._last_wipe_ts = now
+        self.after_idle(self._animate_wipe)
+    
+    def _animate_wipe(self) -> None:
+        """Flash the window background red (GUI thread only)."""
+        self._set_background(Colors.DANGER_RED)
+        # Draw pending changes only - update() would dispatch events re-entrantly
+        self.update_idletasks()
+        self.after(100, functools.partial(self._set_background, Colors.BACKGROUND))
+    
+    def _set_background(self, color: str) -> None:
+        """Recolor the window background (GUI thread only)."""
+        self.configure(fg_color=color)
+        # Once built, the overlay stays placed (just lowered) and is what
+        # shows in the margins around the main frame, so it must match
+        if self.blur_overlay is not None:
+            self.blur_overlay.configure(fg_color=color)
@@ -22,10 +22,13 @@ Options:
 
 import os
 import sys
+import mmap
 import time
 import signal
 import atexit
 import argparse
+import ctypes
+import functools
 import threading
 from typing import Optional
 
@@ -38,6 +41,86 @@ from gui import GhostProtocolGUI, Colors
 from security_threads import CameraSentinel, USBGuard, get_system_info
 
 
+def _buffer_address(buf) -> int:
+    """Return the address of a writable buffer's storage (bytearray, mmap)."""
+    return ctypes.addressof((ctypes.c_char * len(buf)).from_buffer(buf))
+
+
+def _load_explicit_bzero():
+    """Return libc's explicit_bzero if the platform provides it, else None."""
+    if sys.platform == "win32":
+        return None
+    try:
+        explicit_bzero = ctypes.CDLL(None).explicit_bzero
+    except (OSError, AttributeError):
+        return None
+    explicit_bzero.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    explicit_bzero.restype = None
+    return explicit_bzero
+
+
+_explicit_bzero = _load_explicit_bzero()
+
+
+def _secure_zero(buf) -> None:
+    """
+    Zero a mutable buffer in place.
+    
+    Uses the OS secure-zero primitive (explicit_bzero) where available and a
+    plain memset through ctypes otherwise - a foreign call the interpreter
+    cannot elide either way.
+    """
+    if not buf:
+        return
+    addr = _buffer_address(buf)
+    if _explicit_bzero is not None:
+        _explicit_bzero(addr, len(buf))
+    else:
+        ctypes.memset(addr, 0, len(buf))
+
+
+def _fill_random(buf) -> None:
+    """Fill a writable buffer with OS randomness in place, leaving no heap copy."""
+    if sys.platform == "win32":
+        status = ctypes.windll.bcrypt.BCryptGenRandom(
+            None, ctypes.c_void_p(_buffer_address(buf)), ctypes.c_ulong(len(buf)),
+            ctypes.c_ulong(0x00000002)  # BCRYPT_USE_SYSTEM_PREFERRED_RNG
+        )
+        if status != 0:
+            raise OSError(f"BCryptGenRandom failed: 0x{status & 0xFFFFFFFF:08x}")
+        return
+    fd = os.open("/dev/urandom", os.O_RDONLY)
+    try:
+        with memoryview(buf) as view:
+            filled = 0
+            while filled < len(view):
+                filled += os.readv(fd, [view[filled:]])
+    finally:
+        os.close(fd)
+
+
+def _set_memory_lock(buf, locked: bool) -> bool:
+    """
+    Pin (or unpin) a buffer's pages in RAM so they are never swapped to disk.
+    
+    Returns:
+        True on success, False if the OS refused (e.g. RLIMIT_MEMLOCK)
+    """
+    addr = ctypes.c_void_p(_buffer_address(buf))
+    size = ctypes.c_size_t(len(buf))
+    try:
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            func = kernel32.VirtualLock if locked else kernel32.VirtualUnlock
+            return bool(func(addr, size))
+        libc = ctypes.CDLL(None)
+        func = libc.mlock if locked else libc.munlock
+        func.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        return func(addr, size) == 0
+    except (OSError, AttributeError):
+        return False
+
+
 class GhostProtocolVault:
     """
     The Vault: RAM-only encrypted storage.
@@ -50,13 +133,35 @@ class GhostProtocolVault:
     def __init__(self):
         """Initialize the vault with a random encryption key."""
         # Generate random AES-256 key (32 bytes = 256 bits)
-        self._key = get_random_bytes(32)
-        
-        # Encrypted data storage (RAM only)
-        self._encrypted_data: bytes = b""
-        self._iv: bytes = b""
+        # Held in an anonymous mapping pinned in RAM and filled in place, so
+        # the master copy is never swapped and nuke_memory can overwrite it.
+        # Note: pycryptodome copies the key into an ordinary, never-zeroed
+        # bytes object for every cipher it builds, so transient unpinned
+        # copies still exist - the lock narrows the swap exposure, it does
+        # not remove it.
+        self._key = mmap.mmap(-1, 32)
+        self._key_locked = _set_memory_lock(self._key, True)
+        if not self._key_locked:
+            print("[VAULT WARNING] Could not lock key memory - it may be swapped to disk")
+        _fill_random(self._key)
+        self._key_view = memoryview(self._key)
+        
+        # Cipher factory with the constant key/mode bound once, so the hot
+        # path only supplies the per-message nonce
+        self._new_cipher = functools.partial(AES.new, self._key_view, AES.MODE_GCM, mac_len=16)
+        
+        # Encrypted data storage (RAM only) - reusable buffers, grown on demand
+        self._ct_buf: bytearray = bytearray(4096)
+        self._pt_buf: bytearray = bytearray(4096)
+        self._ct_len = 0
         self._tag: bytes = b""  # GCM authentication tag
         
+        # Nonce = 4-byte random prefix + 8-byte counter (12 bytes, GCM fast path),
+        # so only one RNG draw is needed for the vault's lifetime. The counter
+        # half is rewritten in place on every encrypt.
+        self._iv = bytearray(get_random_bytes(4) + bytes(8))
+        self._nonce_ctr = 0
+        
         # Flag to indicate if vault has been nuked
         self._nuked = False
         
@@ -74,15 +179,23 @@ class GhostProtocolVault:
             return
         
         try:
-            # Generate random IV/nonce for each encryption
-            self._iv = get_random_bytes(12)  # 12 bytes (96 bits) is recommended for GCM
+            # Deterministic 96-bit GCM nonce: fixed random prefix + message counter
+            if self._nonce_ctr >= 2 ** 64:
+                raise ValueError("GCM nonce space exhausted")
+            self._iv[4:] = self._nonce_ctr.to_bytes(8, 'big')
+            self._nonce_ctr += 1
             
             # Create cipher
-            cipher = AES.new(self._key, AES.MODE_GCM, nonce=self._iv)
+            cipher = self._new_cipher(nonce=self._iv)
             
-            # Encrypt data and get authentication tag
+            # Encrypt data in place into the reusable buffer and get authentication tag
             plaintext_bytes = plaintext.encode('utf-8')
-            self._encrypted_data, self._tag = cipher.encrypt_and_digest(plaintext_bytes)
+            data_len = len(plaintext_bytes)
+            if data_len > len(self._ct_buf):
+                self._ct_buf = bytearray(max(data_len, 2 * len(self._ct_buf)))
+            cipher.encrypt(plaintext_bytes, output=memoryview(self._ct_buf)[:data_len])
+            self._tag = cipher.digest()
+            self._ct_len = data_len
             
         except Exception as e:
             print(f"[VAULT ERROR] Encryption failed: {e}")
@@ -94,16 +207,26 @@ class GhostProtocolVault:
         Returns:
             The decrypted plaintext
         """
-        if self._nuked or not self._encrypted_data or not self._tag:
+        if self._nuked or not self._ct_len or not self._tag:
             return ""
         
         try:
             # Create cipher with stored IV
-            cipher = AES.new(self._key, AES.MODE_GCM, nonce=self._iv)
+            cipher = self._new_cipher(nonce=self._iv)
             
-            # Decrypt and verify authentication tag
-            plaintext_bytes = cipher.decrypt_and_verify(self._encrypted_data, self._tag)
-            return plaintext_bytes.decode('utf-8')
+            # Decrypt into the reusable buffer and verify authentication tag
+            data_len = self._ct_len
+            if data_len > len(self._pt_buf):
+                _secure_zero(self._pt_buf)
+                self._pt_buf = bytearray(max(data_len, 2 * len(self._pt_buf)))
+            plaintext_view = memoryview(self._pt_buf)[:data_len]
+            try:
+                cipher.decrypt(memoryview(self._ct_buf)[:data_len], output=plaintext_view)
+                cipher.verify(self._tag)
+                return str(plaintext_view, 'utf-8')
+            finally:
+                # The buffer is only scratch space - don't leave plaintext in it
+                _secure_zero(plaintext_view)
             
         except Exception as e:
             print(f"[VAULT ERROR] Decryption failed: {e}")
@@ -113,8 +236,8 @@ class GhostProtocolVault:
         """
         Securely wipe all sensitive data from memory.
         
-        This overwrites the encryption key, encrypted data, and IV
-        with random bytes before setting them to empty values.
+        This zeroes the encryption key, nonce, and data buffers in place,
+        then unlocks and unmaps the key page.
         """
         if self._nuked:
             return
@@ -122,40 +245,30 @@ class GhostProtocolVault:
         print("[VAULT] ████ INITIATING MEMORY WIPE ████")
         
         try:
-            # Overwrite key with random data multiple times
-            key_len = len(self._key) if self._key else 32
-            for _ in range(3):
-                self._key = os.urandom(key_len)
-            self._key = b"\x00" * key_len
-            
-            # Overwrite encrypted data
-            data_len = len(self._encrypted_data) if self._encrypted_data else 0
-            if data_len > 0:
-                for _ in range(3):
-                    self._encrypted_data = os.urandom(data_len)
-            self._encrypted_data = b""
-            
-            # Overwrite IV
-            iv_len = len(self._iv) if self._iv else 12
-            for _ in range(3):
-                self._iv = os.urandom(iv_len)
-            self._iv = b""
-            
-            # Overwrite tag
-            tag_len = len(self._tag) if self._tag else 16
-            for _ in range(3):
-                self._tag = os.urandom(tag_len)
+            # One in-place zeroing per buffer. Rebinding to fresh random
+            # bytes (however many passes) never touched the original memory.
+            for buf in (self._key, self._iv, self._ct_buf, self._pt_buf):
+                _secure_zero(buf)
+            self._ct_len = 0
             self._tag = b""
             
+            # Unpin and unmap the key page
+            if self._key_locked:
+                _set_memory_lock(self._key, False)
+            self._key_view.release()
+            self._key.close()
+            
             self._nuked = True
             print("[VAULT] Memory wipe complete. All traces eliminated.")
             
         except Exception as e:
             print(f"[VAULT ERROR] Memory wipe error: {e}")
             # Force overwrite even on error
-            self._key = b""
-            self._encrypted_data = b""
-            self._iv = b""
+            self._key = bytearray()
+            self._ct_buf = bytearray()
+            self._pt_buf = bytearray()
+            self._ct_len = 0
+            self._iv = bytearray()
             self._nuked = True
 
 
@@ -187,9 +300,10 @@ class GhostProtocol:
         self.camera_sentinel: Optional[CameraSentinel] = None
         self.usb_guard: Optional[USBGuard] = None
         
-        # Panic state
+        # Panic state - the claim lock is taken once and never released,
+        # so exactly one caller wins and later callers bail out without blocking
         self._panic_triggered = False
-        self._panic_lock = threading.Lock()
+        self._panic_claim = threading.Lock()
         
         # Register cleanup handlers
         atexit.register(self._cleanup)
@@ -241,10 +355,9 @@ class GhostProtocol:
         - Manual panic button pressed
         - Termination signal received
         """
-        with self._panic_lock:
-            if self._panic_triggered:
-                return
-            self._panic_triggered = True
+        if not self._panic_claim.acquire(blocking=False):
+            return
+        self._panic_triggered = True
         
         print("")
         print("╔" + "═" * 58 + "╗")
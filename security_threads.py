@@ -8,13 +8,35 @@ All security monitoring runs in background threads.
 import os
 import sys
 import time
+import functools
 import threading
 import platform
 from typing import Callable, Optional
 
 import cv2
+import numpy as np
 import psutil
 
+if platform.system() == "Windows":
+    import ctypes
+    from ctypes import wintypes
+    
+    # Bound once at import: typed function pointer plus a reusable label buffer
+    _GetVolumeInformationW = ctypes.windll.kernel32.GetVolumeInformationW
+    _GetVolumeInformationW.argtypes = [
+        wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD,
+        wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD,
+        wintypes.LPWSTR, wintypes.DWORD,
+    ]
+    _GetVolumeInformationW.restype = wintypes.BOOL
+    _vol_buf = ctypes.create_unicode_buffer(1024)
+    _vol_buf_lock = threading.Lock()
+
+try:
+    import pyudev  # Optional: event-driven USB monitoring on Linux
+except ImportError:
+    pyudev = None
+
 
 class SecurityMonitor:
     """Base class for security monitoring threads."""
@@ -41,7 +63,8 @@ class SecurityMonitor:
     def stop(self) -> None:
         """Stop the monitoring thread."""
         self._running = False
-        if self._thread is not None:
+        # The panic path calls stop() from the monitor's own thread - don't self-join
+        if self._thread is not None and self._thread is not threading.current_thread():
             self._thread.join(timeout=2.0)
     
     def _monitor_loop(self) -> None:
@@ -58,6 +81,17 @@ class CameraSentinel(SecurityMonitor):
     """
     
     FRAME_INTERVAL = 0.5  # Process 1 frame every 0.5 seconds
+    FRAME_WIDTH = 320     # Capture resolution requested from the camera
+    FRAME_HEIGHT = 240
+    
+    # Motion gate: skip detection while a single user sits still
+    MOTION_PIXEL_DELTA = 12     # Per-pixel gray change that counts as motion
+    MOTION_AREA_DIVISOR = 200   # Motion if more than 1/200 of pixels changed
+    MAX_DETECT_AGE = 5.0        # Always re-run detection at least this often
+    
+    # Optional YuNet face detection model (OpenCV Zoo), used instead of Haar if present
+    YUNET_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "face_detection_yunet_2023mar.onnx")
     
     def __init__(self, panic_callback: Callable[[], None], 
                  status_callback: Callable[[str, str], None],
@@ -74,26 +108,61 @@ class CameraSentinel(SecurityMonitor):
         self.blur_callback = blur_callback
         self.cap: Optional[cv2.VideoCapture] = None
         self.face_cascade: Optional[cv2.CascadeClassifier] = None
+        self.face_detector: Optional["cv2.FaceDetectorYN"] = None
+        self._detector_size = (self.FRAME_WIDTH, self.FRAME_HEIGHT)
+        self._frame: Optional[np.ndarray] = None
+        self._gray: Optional[np.ndarray] = None
+        self._prev_gray: Optional[np.ndarray] = None
+        self._diff: Optional[np.ndarray] = None
+        self._last_detect_ts = 0.0
         self._camera_available = False
+        self._last_face_count = 1
     
     def _initialize_camera(self) -> bool:
         """Initialize camera and face detection cascade."""
         try:
-            # Load the Haar cascade for face detection
-            cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-            self.face_cascade = cv2.CascadeClassifier(cascade_path)
-            
-            if self.face_cascade.empty():
-                print("[WARNING] Failed to load face cascade classifier")
-                return False
+            # Prefer the YuNet DNN detector when its model is available,
+            # otherwise fall back to the Haar cascade
+            if os.path.exists(self.YUNET_MODEL_PATH) and hasattr(cv2, "FaceDetectorYN"):
+                self.face_detector = cv2.FaceDetectorYN.create(
+                    self.YUNET_MODEL_PATH, "",
+                    (self.FRAME_WIDTH, self.FRAME_HEIGHT),
+                    score_threshold=0.7
+                )
+                print("[SYSTEM] Face detector: YuNet")
+            else:
+                # Load the Haar cascade for face detection
+                cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+                self.face_cascade = cv2.CascadeClassifier(cascade_path)
+                
+                if self.face_cascade.empty():
+                    print("[WARNING] Failed to load face cascade classifier")
+                    return False
             
-            # Try to open the camera
-            self.cap = cv2.VideoCapture(0)
+            # Try to open the camera (on Linux, use the V4L2 backend directly -
+            # it streams from mmap'd driver buffers without a GStreamer pipeline)
+            self.cap = None
+            if platform.system() == "Linux":
+                self.cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
+            if self.cap is None or not self.cap.isOpened():
+                self.cap = cv2.VideoCapture(0)
             if not self.cap.isOpened():
                 print("[WARNING] Camera not available. Sentinel in STANDBY mode.")
                 self.status_callback("camera", "NO CAMERA")
                 return False
             
+            # Capture at low resolution - Haar detection cost scales with pixel count
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.FRAME_WIDTH)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.FRAME_HEIGHT)
+            
+            # Preallocate frame buffers at the resolution the camera actually gave us
+            width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or self.FRAME_WIDTH
+            height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or self.FRAME_HEIGHT
+            self._frame = np.empty((height, width, 3), np.uint8)
+            self._gray = np.empty((height, width), np.uint8)
+            self._prev_gray = np.empty((height, width), np.uint8)
+            self._diff = np.empty((height, width), np.uint8)
+            
             self._camera_available = True
             self.status_callback("camera", "ARMED")
             print("[SYSTEM] SENTINEL ACTIVATED. Camera monitoring initiated.")
@@ -104,75 +173,118 @@ class CameraSentinel(SecurityMonitor):
             self.status_callback("camera", "ERROR")
             return False
     
+    def _count_faces(self, frame, gray) -> int:
+        """Run the loaded face detector and return the face count."""
+        if self.face_detector is not None:
+            # YuNet works on the BGR frame directly; keep its input size in sync
+            height, width = frame.shape[:2]
+            if self._detector_size != (width, height):
+                self.face_detector.setInputSize((width, height))
+                self._detector_size = (width, height)
+            _, faces = self.face_detector.detect(frame)
+            return 0 if faces is None else len(faces)
+        
+        # Detect faces
+        faces = self.face_cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.2,
+            minNeighbors=5,
+            minSize=(30, 30)
+        )
+        return len(faces)
+    
+    def _is_scene_static(self, gray, prev_gray) -> bool:
+        """Return True if detection can be skipped for this frame."""
+        if (self._last_face_count != 1
+                or time.monotonic() - self._last_detect_ts >= self.MAX_DETECT_AGE
+                or prev_gray.shape != gray.shape):
+            return False
+        
+        diff = cv2.absdiff(gray, prev_gray, dst=self._diff)
+        _, moved = cv2.threshold(diff, self.MOTION_PIXEL_DELTA, 255, cv2.THRESH_BINARY, dst=diff)
+        self._diff = moved
+        return cv2.countNonZero(moved) < gray.size // self.MOTION_AREA_DIVISOR
+    
     def _monitor_loop(self) -> None:
         """Main monitoring loop for face detection."""
         if not self._initialize_camera():
-            # Camera not available, run in degraded mode
-            while self._running:
-                time.sleep(1.0)
+            # Camera not available - nothing to watch (degraded mode)
             return
         
-        last_face_count = 1  # Assume user is present initially
+        self._last_face_count = 1  # Assume user is present initially
         
         while self._running:
-            try:
-                ret, frame = self.cap.read()
-                if not ret:
-                    time.sleep(self.FRAME_INTERVAL)
-                    continue
-                
-                # Convert to grayscale for face detection
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                
-                # Detect faces
-                faces = self.face_cascade.detectMultiScale(
-                    gray,
-                    scaleFactor=1.1,
-                    minNeighbors=5,
-                    minSize=(30, 30)
-                )
-                
-                face_count = len(faces)
-                
-                if face_count == 0:
-                    # User left desk - blur and lock
-                    if last_face_count != 0:
-                        print("[ALERT] USER ABSENT. Engaging privacy shield.")
-                        self.status_callback("camera", "LOCKED")
-                        self.blur_callback(True)
-                
-                elif face_count == 1:
-                    # Normal operation - single authorized user
-                    if last_face_count != 1:
-                        print("[SYSTEM] User presence confirmed. Disengaging privacy shield.")
-                        self.status_callback("camera", "ARMED")
-                        self.blur_callback(False)
-                
-                else:
-                    # INTRUDER DETECTED - PANIC WIPE
-                    print("")
-                    print("=" * 60)
-                    print("[CRITICAL] ████ INTRUDER DETECTED ████")
-                    print("[CRITICAL] MULTIPLE FACES DETECTED. SHOULDER SURFER ALERT!")
-                    print("[CRITICAL] INITIATING PROTOCOL 0.")
-                    print("=" * 60)
-                    print("")
-                    self.status_callback("camera", "BREACH")
-                    self.status_callback("threat", "CRITICAL")
-                    self.panic_callback()
-                    break
-                
-                last_face_count = face_count
-                
-            except Exception as e:
-                print(f"[ERROR] Camera processing error: {e}")
-            
+            if not self._process_frame():
+                break
             time.sleep(self.FRAME_INTERVAL)
         
         # Cleanup
         if self.cap is not None:
             self.cap.release()
     
+    def _process_frame(self) -> bool:
+        """
+        Grab one frame and act on the number of faces in it.
+        
+        Returns:
+            False if panic was triggered and monitoring must end, True otherwise
+        """
+        try:
+            # Read into the preallocated buffer (OpenCV reallocates on size change)
+            ret, frame = self.cap.read(self._frame)
+            if not ret:
+                return True
+            self._frame = frame
+            
+            # Convert to grayscale, reusing the gray buffer
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+            
+            # Swap buffers so this frame becomes the next frame's reference (no copy)
+            prev_gray = self._prev_gray
+            self._gray, self._prev_gray = prev_gray, gray
+            
+            if self._is_scene_static(gray, prev_gray):
+                # Single user, nothing moved: state is assumed unchanged
+                return True
+            
+            face_count = self._count_faces(frame, gray)
+            self._last_detect_ts = time.monotonic()
+            
+            if face_count == 0:
+                # User left desk - blur and lock
+                if self._last_face_count != 0:
+                    print("[ALERT] USER ABSENT. Engaging privacy shield.")
+                    self.status_callback("camera", "LOCKED")
+                    self.blur_callback(True)
+            
+            elif face_count == 1:
+                # Normal operation - single authorized user
+                if self._last_face_count != 1:
+                    print("[SYSTEM] User presence confirmed. Disengaging privacy shield.")
+                    self.status_callback("camera", "ARMED")
+                    self.blur_callback(False)
+            
+            else:
+                # INTRUDER DETECTED - PANIC WIPE
+                print("")
+                print("=" * 60)
+                print("[CRITICAL] ████ INTRUDER DETECTED ████")
+                print("[CRITICAL] MULTIPLE FACES DETECTED. SHOULDER SURFER ALERT!")
+                print("[CRITICAL] INITIATING PROTOCOL 0.")
+                print("=" * 60)
+                print("")
+                self.status_callback("camera", "BREACH")
+                self.status_callback("threat", "CRITICAL")
+                self.panic_callback()
+                return False
+            
+            self._last_face_count = face_count
+            
+        except Exception as e:
+            print(f"[ERROR] Camera processing error: {e}")
+        
+        return True
+    
     def stop(self) -> None:
         """Stop the camera monitoring and release resources."""
         super().stop()
@@ -189,8 +301,13 @@ class USBGuard(SecurityMonitor):
     """
     
     CHECK_INTERVAL = 0.5  # Check USB status every 0.5 seconds
+    UDEV_RESCAN_INTERVAL = 2.0  # Max wait between udev events before re-checking
     REQUIRED_USB_NAME = "GHOST_KEY"
     
+    # Last partition-table signature and its scan result (shared by all callers)
+    _last_sig = None
+    _last_result = False
+    
     def __init__(self, panic_callback: Callable[[], None], 
                  status_callback: Callable[[str, str], None]):
         super().__init__(panic_callback, status_callback)
@@ -207,59 +324,110 @@ class USBGuard(SecurityMonitor):
             True if GHOST_KEY is present, False otherwise
         """
         try:
+            if platform.system() == "Linux":
+                try:
+                    with open("/proc/self/mountinfo", "rb") as f:
+                        return cls._check_linux_mounts(f.read())
+                except OSError:
+                    pass  # No procfs - use the portable psutil path below
+            
             partitions = psutil.disk_partitions(all=True)
             
-            for partition in partitions:
-                # Check the mount point or device name for GHOST_KEY
-                mount_point = partition.mountpoint
-                device = partition.device
-                
-                if platform.system() == "Windows":
-                    # On Windows, check volume label
-                    try:
-                        import ctypes
-                        kernel32 = ctypes.windll.kernel32
-                        volume_name = ctypes.create_unicode_buffer(1024)
-                        kernel32.GetVolumeInformationW(
-                            mount_point + "\\",
-                            volume_name, 1024,
-                            None, None, None, None, 0
-                        )
-                        if volume_name.value == cls.REQUIRED_USB_NAME:
-                            return True
-                    except Exception:
-                        pass
-                else:
-                    # On Linux/Mac, check if GHOST_KEY is in mount path
-                    if cls.REQUIRED_USB_NAME in mount_point:
-                        return True
-                    
-                    # Also check /dev/disk/by-label on Linux
-                    label_path = f"/dev/disk/by-label/{cls.REQUIRED_USB_NAME}"
-                    if os.path.exists(label_path):
-                        return True
-                    
-                    # Check /media and /mnt directories for GHOST_KEY
-                    for base_dir in ["/media", "/mnt", "/run/media"]:
-                        if os.path.exists(base_dir):
-                            try:
-                                for user_dir in os.listdir(base_dir):
-                                    key_path = os.path.join(base_dir, user_dir, cls.REQUIRED_USB_NAME)
-                                    if os.path.exists(key_path) and os.path.isdir(key_path):
-                                        return True
-                                    # Also check direct mount
-                                    if user_dir == cls.REQUIRED_USB_NAME:
-                                        return True
-                            except PermissionError:
-                                # Skip directories we don't have permission to read
-                                continue
+            # Skip the full scan while the mount table (and, off Windows, the
+            # by-label link) is unchanged since the last check. fstype/opts are
+            # part of the signature: Windows keeps listing a drive letter whose
+            # media was pulled (e.g. a card-reader slot), only with an empty
+            # fstype, so a media change must still force a re-scan.
+            label_present = (platform.system() != "Windows"
+                             and os.path.exists(f"/dev/disk/by-label/{cls.REQUIRED_USB_NAME}"))
+            sig = (tuple(sorted((p.device, p.mountpoint, p.fstype, p.opts) for p in partitions)),
+                   label_present)
+            if sig == cls._last_sig:
+                return cls._last_result
             
-            return False
+            result = cls._scan_partitions(partitions)
+            cls._last_sig, cls._last_result = sig, result
+            return result
             
         except Exception as e:
             print(f"[ERROR] USB check failed: {e}")
             return False
     
+    @classmethod
+    def _check_linux_mounts(cls, mounts: bytes) -> bool:
+        """
+        Linux fast path: decide from the raw /proc/self/mountinfo contents.
+        
+        Only when GHOST_KEY appears in the mount table are the partitions
+        resolved through psutil; otherwise no mount point can match, so just
+        the by-label link and media directories are checked.
+        """
+        label_present = os.path.exists(f"/dev/disk/by-label/{cls.REQUIRED_USB_NAME}")
+        sig = (mounts, label_present)
+        if sig == cls._last_sig:
+            return cls._last_result
+        
+        if cls.REQUIRED_USB_NAME.encode() in mounts:
+            result = cls._scan_partitions(psutil.disk_partitions(all=True))
+        else:
+            result = label_present or cls._scan_media_dirs()
+        
+        cls._last_sig, cls._last_result = sig, result
+        return result
+    
+    @classmethod
+    def _scan_partitions(cls, partitions) -> bool:
+        """Scan mounted partitions for the GHOST_KEY volume."""
+        if platform.system() == "Windows":
+            with _vol_buf_lock:
+                for partition in partitions:
+                    # On Windows, check volume label (buffer is only valid on success)
+                    try:
+                        if (_GetVolumeInformationW(
+                                partition.mountpoint + "\\",
+                                _vol_buf, 1024,
+                                None, None, None, None, 0
+                            ) and _vol_buf.value == cls.REQUIRED_USB_NAME):
+                            return True
+                    except Exception:
+                        pass
+            return False
+        
+        # On Linux/Mac, check if GHOST_KEY is in mount path
+        for partition in partitions:
+            if cls.REQUIRED_USB_NAME in partition.mountpoint:
+                return True
+        
+        # The remaining checks don't depend on the partition, so run them once
+        # Also check /dev/disk/by-label on Linux
+        label_path = f"/dev/disk/by-label/{cls.REQUIRED_USB_NAME}"
+        if os.path.exists(label_path):
+            return True
+        
+        return cls._scan_media_dirs()
+    
+    @classmethod
+    def _scan_media_dirs(cls) -> bool:
+        """Check /media, /mnt and /run/media for a GHOST_KEY mount directory."""
+        for base_dir in ("/media", "/mnt", "/run/media"):
+            try:
+                # scandir's DirEntry carries the d_type from readdir, so
+                # is_dir() on the listed entries costs no extra stat
+                with os.scandir(base_dir) as entries:
+                    for entry in entries:
+                        # Direct mount
+                        if entry.name == cls.REQUIRED_USB_NAME:
+                            return True
+                        # Per-user mount (e.g. /media/<user>/GHOST_KEY) - one stat
+                        if (entry.is_dir()
+                                and os.path.isdir(os.path.join(entry.path, cls.REQUIRED_USB_NAME))):
+                            return True
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                # Skip missing directories or ones we don't have permission to read
+                continue
+        
+        return False
+    
     def set_bypass_mode(self, bypass: bool) -> None:
         """
         Enable or disable bypass mode (for development/testing).
@@ -282,8 +450,6 @@ class USBGuard(SecurityMonitor):
         if bypass_mode:
             self.status_callback("usb", "BYPASSED")
             print("[WARNING] USB Guard running in BYPASS mode")
-            while self._running:
-                time.sleep(self.CHECK_INTERVAL)
             return
         
         # Initial check
@@ -298,41 +464,93 @@ class USBGuard(SecurityMonitor):
         
         initial_state = self._usb_present
         
+        if pyudev is not None and platform.system() == "Linux":
+            self._udev_loop(initial_state)
+        else:
+            self._poll_loop(initial_state)
+    
+    def _poll_loop(self, initial_state: bool) -> None:
+        """Fallback loop: re-scan partitions every CHECK_INTERVAL seconds."""
+        while self._running:
+            if not self._handle_usb_state(self.check_ghost_key_present(), initial_state):
+                break
+            time.sleep(self.CHECK_INTERVAL)
+    
+    def _udev_loop(self, initial_state: bool) -> None:
+        """Linux loop: block on udev block-device events instead of polling."""
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by("block")
+        monitor.start()
+        
         while self._running:
-            current_state = self.check_ghost_key_present()
+            # Wake on a device event, or periodically to catch late (auto)mounts
+            device = monitor.poll(timeout=self.UDEV_RESCAN_INTERVAL)
+            if (device is not None and device.action == "remove"
+                    and device.get("ID_FS_LABEL") == self.REQUIRED_USB_NAME):
+                current_state = False
+            else:
+                current_state = self.check_ghost_key_present()
             
-            if initial_state and not current_state:
-                # USB was present at start but now removed - PANIC
-                print("")
-                print("=" * 60)
-                print("[CRITICAL] ████ DEAD MAN'S KEY REMOVED ████")
-                print("[CRITICAL] GHOST_KEY USB DISCONNECTED!")
-                print("[CRITICAL] INITIATING PROTOCOL 0.")
-                print("=" * 60)
-                print("")
-                self.status_callback("usb", "REMOVED")
-                self.status_callback("threat", "CRITICAL")
-                self.panic_callback()
+            if not self._handle_usb_state(current_state, initial_state):
                 break
-            
-            if current_state and not self._usb_present:
-                # USB reconnected
-                self.status_callback("usb", "SECURE")
-                print("[SYSTEM] GHOST_KEY reconnected. Security restored.")
-            elif not current_state and self._usb_present:
-                # USB disconnected (but was not present at start)
-                self.status_callback("usb", "NO KEY")
-            
-            self._usb_present = current_state
-            time.sleep(self.CHECK_INTERVAL)
+    
+    def _handle_usb_state(self, current_state: bool, initial_state: bool) -> bool:
+        """
+        React to the latest USB presence state.
+        
+        Returns:
+            False if the key was removed and panic was triggered, True otherwise
+        """
+        if initial_state and not current_state:
+            # USB was present at start but now removed - PANIC
+            print("")
+            print("=" * 60)
+            print("[CRITICAL] ████ DEAD MAN'S KEY REMOVED ████")
+            print("[CRITICAL] GHOST_KEY USB DISCONNECTED!")
+            print("[CRITICAL] INITIATING PROTOCOL 0.")
+            print("=" * 60)
+            print("")
+            self.status_callback("usb", "REMOVED")
+            self.status_callback("threat", "CRITICAL")
+            self.panic_callback()
+            return False
+        
+        if current_state and not self._usb_present:
+            # USB reconnected
+            self.status_callback("usb", "SECURE")
+            print("[SYSTEM] GHOST_KEY reconnected. Security restored.")
+        elif not current_state and self._usb_present:
+            # USB disconnected (but was not present at start)
+            self.status_callback("usb", "NO KEY")
+        
+        self._usb_present = current_state
+        return True
+
+
+def _processor_name() -> str:
+    """Return the CPU model name without shelling out (platform.processor may spawn uname/WMI)."""
+    system = platform.system()
+    if system == "Linux":
+        try:
+            with open("/proc/cpuinfo") as f:
+                for line in f:
+                    if line.startswith("model name"):
+                        return line.split(":", 1)[1].strip()
+        except OSError:
+            pass
+        return platform.machine()
+    if system == "Windows":
+        return os.environ.get("PROCESSOR_IDENTIFIER", "")
+    return platform.processor()
 
 
+@functools.lru_cache(maxsize=1)
 def get_system_info() -> dict:
-    """Get system information for security logging."""
+    """Get system information for security logging (computed once)."""
     return {
         "platform": platform.system(),
         "platform_release": platform.release(),
         "architecture": platform.machine(),
-        "processor": platform.processor(),
+        "processor": _processor_name(),
         "python_version": platform.python_version(),
     }